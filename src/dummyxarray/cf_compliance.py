@@ -5,10 +5,101 @@ This module provides mixins for CF convention validation and automatic
 axis detection (X/Y/Z/T) based on coordinate metadata.
 """
 
+from functools import lru_cache
+
+# Axis lookup tables used by _axis_from_metadata
+_CF_STANDARD_NAME_MAP = {
+    "longitude": "X",
+    "projection_x_coordinate": "X",
+    "grid_longitude": "X",
+    "latitude": "Y",
+    "projection_y_coordinate": "Y",
+    "grid_latitude": "Y",
+    "altitude": "Z",
+    "height": "Z",
+    "depth": "Z",
+    "air_pressure": "Z",
+    "model_level_number": "Z",
+    "time": "T",
+}
+_CF_TIME_PATTERNS = ("since", "days", "hours", "minutes", "seconds")
+_CF_LON_UNITS = frozenset({"degrees_east", "degree_east", "degreee", "degreese"})
+_CF_LAT_UNITS = frozenset({"degrees_north", "degree_north", "degreen", "degreesn"})
+_CF_VERTICAL_PREFIXES = ("pa", "hpa", "mbar", "bar", "m", "km", "level", "sigma", "eta")
+
+# Recommended CF dimension order (T, Z, Y, X) as axis -> position
+_CF_AXIS_RANK = {"T": 0, "Z": 1, "Y": 2, "X": 3}
+
+# Coordinate name prefixes per axis, checked in order
+_NAME_PREFIXES = (
+    ("X", ("lon", "longitude", "x", "i", "ni", "xc")),
+    ("Y", ("lat", "latitude", "y", "j", "nj", "yc")),
+    ("Z", ("lev", "level", "plev", "height", "depth", "alt", "z", "k", "nk")),
+    ("T", ("time", "t", "date")),
+)
+
+
+@lru_cache(maxsize=1024)
+def _axis_from_metadata(standard_name, units, name):
+    """
+    Detect the axis type from a coordinate's standard_name, units and name.
+
+    Pure helper behind CFComplianceMixin._detect_axis_type, memoized because
+    the same metadata repeats across coordinates and datasets.
+
+    Parameters
+    ----------
+    standard_name : str
+        Value of the standard_name attribute ("" if missing)
+    units : str
+        Value of the units attribute ("" if missing)
+    name : str
+        Coordinate name
+
+    Returns
+    -------
+    str or None
+        Axis type ('X', 'Y', 'Z', 'T') or None if cannot be determined
+    """
+    # Check standard_name (CF convention)
+    standard_name = standard_name.lower()
+    axis = _CF_STANDARD_NAME_MAP.get(standard_name)
+    if axis:
+        return axis
+
+    # Check units (CF convention)
+    units = units.lower()
+
+    # Time axis patterns
+    if any(pattern in units for pattern in _CF_TIME_PATTERNS):
+        return "T"
+
+    # Longitude patterns
+    if units in _CF_LON_UNITS:
+        return "X"
+
+    # Latitude patterns
+    if units in _CF_LAT_UNITS:
+        return "Y"
+
+    # Vertical coordinate patterns
+    if units.startswith(_CF_VERTICAL_PREFIXES):
+        return "Z"
+
+    # Check coordinate name patterns (common conventions)
+    name_lower = name.lower()
+    for axis, prefixes in _NAME_PREFIXES:
+        if name_lower.startswith(prefixes):
+            return axis
+
+    return None
+
 
 class CFComplianceMixin:
     """Mixin providing CF compliance and axis detection capabilities."""
 
+    __slots__ = ()
+
     def infer_axis(self, coord_name=None):
         """
         Infer axis attribute (X/Y/Z/T) for coordinates based on CF conventions.
@@ -39,13 +130,13 @@ class CFComplianceMixin:
         >>> # Returns: {'time': 'T', 'lat': 'Y', 'lon': 'X'}
         """
         axes = {}
-        coords_to_check = [coord_name] if coord_name else list(self.coords.keys())
+        if coord_name:
+            coord = self.coords.get(coord_name)
+            items = ((coord_name, coord),) if coord is not None else ()
+        else:
+            items = self.coords.items()
 
-        for name in coords_to_check:
-            if name not in self.coords:
-                continue
-
-            coord = self.coords[name]
+        for name, coord in items:
             axis = self._detect_axis_type(name, coord)
             if axis:
                 axes[name] = axis
@@ -68,74 +159,14 @@ class CFComplianceMixin:
         str or None
             Axis type ('X', 'Y', 'Z', 'T') or None if cannot be determined
         """
+        attrs = coord.attrs
+
         # Check if axis already set
-        if coord.attrs.get("axis"):
-            return coord.attrs["axis"]
-
-        # Check standard_name (CF convention)
-        standard_name = coord.attrs.get("standard_name", "").lower()
-        standard_name_map = {
-            "longitude": "X",
-            "projection_x_coordinate": "X",
-            "grid_longitude": "X",
-            "latitude": "Y",
-            "projection_y_coordinate": "Y",
-            "grid_latitude": "Y",
-            "altitude": "Z",
-            "height": "Z",
-            "depth": "Z",
-            "air_pressure": "Z",
-            "model_level_number": "Z",
-            "time": "T",
-        }
-        if standard_name in standard_name_map:
-            return standard_name_map[standard_name]
-
-        # Check units (CF convention)
-        units = coord.attrs.get("units", "").lower()
-
-        # Time axis patterns
-        time_patterns = ["since", "days", "hours", "minutes", "seconds"]
-        if any(pattern in units for pattern in time_patterns):
-            return "T"
-
-        # Longitude patterns
-        if units in ["degrees_east", "degree_east", "degreee", "degreese"]:
-            return "X"
-
-        # Latitude patterns
-        if units in ["degrees_north", "degree_north", "degreen", "degreesn"]:
-            return "Y"
-
-        # Vertical coordinate patterns
-        vertical_units = ["pa", "hpa", "mbar", "bar", "m", "km", "level", "sigma", "eta"]
-        if any(units.startswith(u) for u in vertical_units):
-            return "Z"
-
-        # Check coordinate name patterns (common conventions)
-        name_lower = name.lower()
-
-        # X-axis patterns
-        x_patterns = ["lon", "longitude", "x", "i", "ni", "xc"]
-        if any(name_lower.startswith(p) or name_lower == p for p in x_patterns):
-            return "X"
-
-        # Y-axis patterns
-        y_patterns = ["lat", "latitude", "y", "j", "nj", "yc"]
-        if any(name_lower.startswith(p) or name_lower == p for p in y_patterns):
-            return "Y"
-
-        # Z-axis patterns
-        z_patterns = ["lev", "level", "plev", "height", "depth", "alt", "z", "k", "nk"]
-        if any(name_lower.startswith(p) or name_lower == p for p in z_patterns):
-            return "Z"
-
-        # T-axis patterns
-        t_patterns = ["time", "t", "date"]
-        if any(name_lower.startswith(p) or name_lower == p for p in t_patterns):
-            return "T"
-
-        return None
+        axis = attrs.get("axis")
+        if axis:
+            return axis
+
+        return _axis_from_metadata(attrs.get("standard_name", ""), attrs.get("units", ""), name)
 
     def set_axis_attributes(self, inferred_only=False):
         """
@@ -209,11 +240,7 @@ class CFComplianceMixin:
         >>> x_coords = ds.get_axis_coordinates("X")
         >>> # Returns: ['lon']
         """
-        coords = []
-        for name, coord in self.coords.items():
-            if coord.attrs.get("axis") == axis:
-                coords.append(name)
-        return coords
+        return [name for name, coord in self.coords.items() if coord.attrs.get("axis") == axis]
 
     def validate_cf(self, strict=False):
         """
@@ -249,10 +276,10 @@ class CFComplianceMixin:
         for name, coord in self.coords.items():
             # Check for axis attribute
             if "axis" not in coord.attrs:
-                inferred = self.infer_axis(name)
-                if name in inferred:
+                axis = self._detect_axis_type(name, coord)
+                if axis:
                     warnings.append(
-                        f"{name}: Missing 'axis' attribute (can be inferred as '{inferred[name]}')"
+                        f"{name}: Missing 'axis' attribute (can be inferred as '{axis}')"
                     )
                 else:
                     warnings.append(f"{name}: Missing 'axis' attribute (cannot infer)")
@@ -288,20 +315,18 @@ class CFComplianceMixin:
                 warnings.append(f"Conventions attribute '{conventions}' does not reference CF")
 
         # Check dimension ordering (CF recommends T, Z, Y, X)
+        # Axis types of coordinates, restricted to the ones with a CF order
+        dim_to_axis = {}
+        for coord_name, coord in self.coords.items():
+            axis = coord.attrs.get("axis")
+            if axis in _CF_AXIS_RANK:
+                dim_to_axis[coord_name] = axis
+
         for name, var in self.variables.items():
             if var.dims and len(var.dims) > 1:
-                # Get axis types for dimensions
-                dim_axes = []
-                for dim in var.dims:
-                    if dim in self.coords:
-                        axis = self.coords[dim].attrs.get("axis")
-                        if axis:
-                            dim_axes.append(axis)
-
                 # Check if order is T, Z, Y, X
-                expected_order = ["T", "Z", "Y", "X"]
-                actual_order = [a for a in dim_axes if a in expected_order]
-                sorted_order = sorted(actual_order, key=lambda x: expected_order.index(x))
+                actual_order = [dim_to_axis[d] for d in var.dims if d in dim_to_axis]
+                sorted_order = sorted(actual_order, key=_CF_AXIS_RANK.__getitem__)
 
                 if actual_order != sorted_order:
                     warnings.append(
@@ -311,6 +311,8 @@ class CFStandardsMixin:
     community-agreed CF standards to datasets.
     """
 
+    __slots__ = ()
+
     def apply_cf_standards(self, verbose: bool = False) -> Dict[str, Any]:
         """Apply CF standards using cf_xarray.
 
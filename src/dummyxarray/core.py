@@ -5,6 +5,8 @@ Provides DummyArray and DummyDataset classes with modular functionality
 through mixins.
 """
 
+from collections import deque
+from itertools import chain, islice
 from typing import Any, Dict, List, Optional
 
 import numpy as np
@@ -13,16 +15,77 @@ import numpy as np
 from .cf_compliance import CFComplianceMixin
 from .cf_standards import CFStandardsMixin
 from .data_generation import DataGenerationMixin
-from .history import HistoryMixin
+from .history import HistoryMixin, _Op
 from .io import IOMixin
 from .mixins.file_tracker import FileTrackerMixin
 from .provenance import ProvenanceMixin
 from .validation import ValidationMixin
 
+# Sentinel for dict lookups where None is a valid value
+_MISSING = object()
+
+# Public DummyDataset attributes that may be assigned directly
+_DATASET_ATTRS = frozenset({"attrs", "coords", "dims", "variables"})
+
+
+def _values_equal(a, b):
+    """Compare attribute values, treating incomparable values (e.g. arrays) as different."""
+    # 1, 1.0 and True compare equal but encode differently (e.g. in netCDF)
+    if type(a) is not type(b):
+        return False
+    try:
+        return bool(a == b)
+    except (TypeError, ValueError):
+        return False
+
+
+def _array_record(existing, name, dims, attrs, data, encoding):
+    """
+    Build the history record for adding an array to ``existing``.
+
+    Parameters
+    ----------
+    existing : dict
+        The coords or variables the array is added to
+    name, dims, attrs, data, encoding
+        Arguments of the add call
+
+    Returns
+    -------
+    args : dict
+        Recorded arguments, with data replaced by a placeholder
+    changes : dict or None
+        Before/after values of a replaced array, or None if ``name`` is new
+    """
+    # Record operation (don't store actual data)
+    args = {}
+    if dims is not None:
+        args["dims"] = dims
+    if attrs:
+        args["attrs"] = attrs
+    if data is not None:
+        args["data"] = "<data>"
+    if encoding:
+        args["encoding"] = encoding
+
+    old = existing.get(name, _MISSING)
+    if old is _MISSING:
+        return args, None
+    # Array already exists - track what changed
+    changes = {}
+    if dims != old.dims:
+        changes["dims"] = {"before": old.dims, "after": dims}
+    if attrs and attrs != old.attrs:
+        changes["attrs"] = {"before": old.attrs.copy(), "after": attrs}
+    return args, changes
+
 
 class DummyArray:
     """Represents a single array (variable or coordinate) with metadata."""
 
+    # Datasets hold many arrays; slots avoid a per-instance __dict__
+    __slots__ = ("__weakref__", "_history", "attrs", "data", "dims", "encoding")
+
     def __init__(self, dims=None, attrs=None, data=None, encoding=None, _record_history=True):
         """
         Initialize a DummyArray.
@@ -46,7 +109,7 @@ class DummyArray:
         self.encoding = encoding or {}
 
         # Operation history tracking
-        self._history = [] if _record_history else None
+        self._history = deque() if _record_history else None
         if _record_history:
             # Record initialization
             init_args = {}
@@ -60,6 +123,31 @@ class DummyArray:
                 init_args["encoding"] = encoding
             self._record_operation("__init__", init_args)
 
+    @property
+    def _np_view(self):
+        """Data as an ndarray; ndarray data is returned without conversion."""
+        data = self.data
+        if type(data) is np.ndarray:
+            return data
+        # Not cached: list data can be changed in place
+        return np.asarray(data)
+
+    @property
+    def _dtype(self):
+        """Data dtype, read from duck arrays (e.g. dask) without converting them."""
+        dtype = getattr(self.data, "dtype", None)
+        if dtype is None:
+            return self._np_view.dtype
+        return dtype
+
+    @property
+    def _shape(self):
+        """Data shape, read from duck arrays (e.g. dask) without converting them."""
+        shape = getattr(self.data, "shape", None)
+        if shape is None:
+            return self._np_view.shape
+        return shape if type(shape) is tuple else tuple(shape)
+
     def __repr__(self):
         """Return a string representation of the DummyArray."""
         lines = ["<dummyxarray.DummyArray>"]
@@ -72,7 +160,7 @@ class DummyArray:
 
         # Data info
         if self.data is not None:
-            data_array = np.asarray(self.data)
+            data_array = self._np_view
             lines.append(f"Shape: {data_array.shape}")
             lines.append(f"dtype: {data_array.dtype}")
 
@@ -80,7 +168,9 @@ class DummyArray:
             if data_array.size <= 10:
                 lines.append(f"Data: {data_array}")
             else:
-                flat = data_array.flatten()
+                # Indexing the flat iterator reads single elements without
+                # copying, whatever the memory layout
+                flat = data_array.flat
                 preview = f"[{flat[0]}, {flat[1]}, ..., {flat[-1]}]"
                 lines.append(f"Data: {preview}")
         else:
@@ -113,7 +203,7 @@ class DummyArray:
             Dictionary mapping dimension names to sizes
         """
         if self.data is not None:
-            shape = np.asarray(self.data).shape
+            shape = self._shape
             if self.dims is None:
                 self.dims = [f"dim_{i}" for i in range(len(shape))]
             return dict(zip(self.dims, shape, strict=True))
@@ -131,7 +221,7 @@ class DummyArray:
             Arguments passed to the function
         """
         if self._history is not None:
-            self._history.append({"func": func_name, "args": args})
+            self._history.append(_Op(func_name, args))
 
     def get_history(self):
         """
@@ -148,7 +238,9 @@ class DummyArray:
         >>> arr.get_history()
         [{'func': '__init__', 'args': {'dims': ['time'], 'attrs': {'units': 'days'}}}]
         """
-        return self._history.copy() if self._history is not None else []
+        if self._history is None:
+            return []
+        return [op.to_dict() for op in self._history]
 
     def replay_history(self, history=None):
         """
@@ -167,15 +259,15 @@ class DummyArray:
         if history is None:
             history = self.get_history()
 
-        # Get __init__ args
-        init_op = history[0] if history and history[0]["func"] == "__init__" else {}
-        init_args = init_op.get("args", {})
+        # Get __init__ args (always recorded first)
+        init_op = history[0] if history and history[0]["func"] == "__init__" else None
+        init_args = init_op["args"] if init_op is not None else {}
 
         # Create new array
         arr = DummyArray(**init_args, _record_history=False)
 
         # Replay other operations
-        for op in history[1:]:
+        for op in islice(history, 1 if init_op is not None else 0, None):
             func = getattr(arr, op["func"], None)
             if func and callable(func):
                 func(**op["args"])
@@ -240,7 +332,14 @@ class DummyDataset(
     creating the actual xarray.Dataset with real data.
     """
 
-    def __init__(self, _record_history=True):
+    # Core fields live in slots; "__dict__" keeps room for mixin and
+    # private attributes, allocated only when one is actually set.
+    __slots__ = ("__dict__", "__weakref__", "_history", "attrs", "coords", "dims", "variables")
+
+    # Class-level dir() entries, filled lazily by __dir__
+    _BASE_DIR = None
+
+    def __init__(self, _record_history=True, history_maxlen=None):
         """
         Initialize an empty DummyDataset.
 
@@ -248,6 +347,9 @@ class DummyDataset(
         ----------
         _record_history : bool, optional
             Whether to record operation history (default: True)
+        history_maxlen : int, optional
+            Maximum number of operations to keep in the history. Once
+            reached, the oldest operations are dropped. Unbounded if None.
         """
         self.dims = {}  # dim_name → size
         self.coords = {}  # coord_name → DummyArray
@@ -255,7 +357,7 @@ class DummyDataset(
         self.attrs = {}  # global attributes
 
         # Operation history tracking
-        self._history = [] if _record_history else None
+        self._history = deque(maxlen=history_maxlen) if _record_history else None
         if _record_history:
             self._record_operation("__init__", {})
 
@@ -277,7 +379,7 @@ class DummyDataset(
             for name, arr in self.coords.items():
                 dims_str = f"({', '.join(arr.dims)})" if arr.dims else "()"
                 has_data = "✓" if arr.data is not None else "✗"
-                dtype_str = f"{arr.data.dtype}" if arr.data is not None else "?"
+                dtype_str = f"{arr._dtype}" if arr.data is not None else "?"
                 lines.append(f"  {has_data} {name:20s} {dims_str:20s} {dtype_str}")
 
         # Data variables
@@ -286,7 +388,7 @@ class DummyDataset(
             for name, arr in self.variables.items():
                 dims_str = f"({', '.join(arr.dims)})" if arr.dims else "()"
                 has_data = "✓" if arr.data is not None else "✗"
-                dtype_str = f"{arr.data.dtype}" if arr.data is not None else "?"
+                dtype_str = f"{arr._dtype}" if arr.data is not None else "?"
                 lines.append(f"  {has_data} {name:20s} {dims_str:20s} {dtype_str}")
 
         # Global attributes
@@ -322,12 +424,21 @@ class DummyDataset(
         AttributeError
             If the name is not found in coords or variables
         """
+        # Private names, dunder probes (copy, pickle) and the containers
+        # themselves never resolve to data; bailing out early also avoids
+        # recursing on instances whose slots are not yet set
+        if name.startswith("_") or name in ("coords", "variables"):
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
         # Check coordinates first (like xarray does)
-        if name in self.coords:
+        try:
             return self.coords[name]
+        except KeyError:
+            pass
         # Then check variables
-        if name in self.variables:
+        try:
             return self.variables[name]
+        except KeyError:
+            pass
         # If not found, raise AttributeError
         raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
 
@@ -340,7 +451,7 @@ class DummyDataset(
         """
         # Internal attributes that should be set normally
         # Allow private attributes (starting with _) for mixins
-        if name in ("dims", "coords", "variables", "attrs", "_history") or name.startswith("_"):
+        if name in _DATASET_ATTRS or name.startswith("_"):
             object.__setattr__(self, name, value)
         else:
             # For now, raise an error to avoid confusion
@@ -356,10 +467,14 @@ class DummyDataset(
 
         This makes tab-completion work in IPython/Jupyter.
         """
-        # Get default attributes
-        default_attrs = set(object.__dir__(self))
-        # Add coordinate and variable names
-        return sorted(default_attrs | set(self.coords.keys()) | set(self.variables.keys()))
+        # Class-level attributes are computed once per class; instance
+        # attributes, coordinates and variables are added per call
+        cls = type(self)
+        base = cls.__dict__.get("_BASE_DIR")
+        if base is None:
+            base = frozenset(dir(cls))
+            cls._BASE_DIR = base
+        return sorted(base.union(self.__dict__, self.coords, self.variables))
 
     # ------------------------------------------------------------
     # Core API
@@ -400,10 +515,17 @@ class DummyDataset(
         >>> ds = DummyDataset()
         >>> ds.assign_attrs(title="My Dataset", institution="DKRZ")
         """
-        # Capture provenance
-        provenance = {"modified": {}}
+        # Capture provenance, only for attributes that actually change
+        provenance = None
+        attrs = self.attrs
         for key, value in kwargs.items():
-            old_value = self.attrs.get(key)
+            old_value = attrs.get(key, _MISSING)
+            if old_value is _MISSING:
+                old_value = None
+            elif _values_equal(old_value, value):
+                continue
+            if provenance is None:
+                provenance = {"modified": {}}
             provenance["modified"][key] = {"before": old_value, "after": value}
 
         self._record_operation("assign_attrs", kwargs, provenance)
@@ -428,8 +550,9 @@ class DummyDataset(
         >>> ds.add_dim("lat", 64)
         """
         # Capture provenance
-        if name in self.dims:
-            provenance = {"modified": {name: {"before": self.dims[name], "after": size}}}
+        old_size = self.dims.get(name, _MISSING)
+        if old_size is not _MISSING:
+            provenance = {"modified": {name: {"before": old_size, "after": size}}}
         else:
             provenance = {"added": [name]}
 
@@ -453,31 +576,15 @@ class DummyDataset(
         encoding : dict, optional
             Encoding parameters
         """
-        # Record operation (don't store actual data)
-        args = {"name": name}
-        if dims is not None:
-            args["dims"] = dims
-        if attrs:
-            args["attrs"] = attrs
-        if data is not None:
-            args["data"] = "<data>"
-        if encoding:
-            args["encoding"] = encoding
+        record, changes = _array_record(self.coords, name, dims, attrs, data, encoding)
+        args = {"name": name, **record}
 
         # Capture provenance
         provenance = {}
-        if name in self.coords:
-            # Coordinate already exists - track what changed
-            old_coord = self.coords[name]
-            changes = {}
-            if dims != old_coord.dims:
-                changes["dims"] = {"before": old_coord.dims, "after": dims}
-            if attrs and attrs != old_coord.attrs:
-                changes["attrs"] = {"before": old_coord.attrs.copy(), "after": attrs}
-            if changes:
-                provenance["modified"] = {name: changes}
-        else:
+        if changes is None:
             provenance["added"] = [name]
+        elif changes:
+            provenance["modified"] = {name: changes}
 
         self._record_operation("add_coord", args, provenance)
 
@@ -502,31 +609,15 @@ class DummyDataset(
         encoding : dict, optional
             Encoding parameters
         """
-        # Record operation (don't store actual data)
-        args = {"name": name}
-        if dims is not None:
-            args["dims"] = dims
-        if attrs:
-            args["attrs"] = attrs
-        if data is not None:
-            args["data"] = "<data>"
-        if encoding:
-            args["encoding"] = encoding
+        record, changes = _array_record(self.variables, name, dims, attrs, data, encoding)
+        args = {"name": name, **record}
 
         # Capture provenance
         provenance = {}
-        if name in self.variables:
-            # Variable already exists - track what changed
-            old_var = self.variables[name]
-            changes = {}
-            if dims != old_var.dims:
-                changes["dims"] = {"before": old_var.dims, "after": dims}
-            if attrs and attrs != old_var.attrs:
-                changes["attrs"] = {"before": old_var.attrs.copy(), "after": attrs}
-            if changes:
-                provenance["modified"] = {name: changes}
-        else:
+        if changes is None:
             provenance["added"] = [name]
+        elif changes:
+            provenance["modified"] = {name: changes}
 
         self._record_operation("add_variable", args, provenance)
 
@@ -534,6 +625,76 @@ class DummyDataset(
         self._infer_and_register_dims(arr)
         self.variables[name] = arr
 
+    def add_variables(self, variables):
+        """
+        Add several data variables at once.
+
+        Equivalent to calling :meth:`add_variable` for each entry, but all
+        dimension sizes are checked before anything is added and a single
+        operation is recorded in the history.
+
+        Parameters
+        ----------
+        variables : dict
+            Mapping of variable name to a dict of :meth:`add_variable`
+            keyword arguments (``dims``, ``attrs``, ``data``, ``encoding``)
+
+        Raises
+        ------
+        ValueError
+            If the data of any variable conflicts with a known dimension size
+            or with another variable; the dataset is then left unchanged
+
+        Examples
+        --------
+        >>> ds = DummyDataset()
+        >>> ds.add_dim("time", 10)
+        >>> ds.add_variables({
+        ...     "tas": {"dims": ["time"], "attrs": {"units": "K"}},
+        ...     "pr": {"dims": ["time"], "attrs": {"units": "kg m-2 s-1"}},
+        ... })
+        """
+        arrays = {
+            name: DummyArray(**spec, _record_history=False) for name, spec in variables.items()
+        }
+
+        # Infer all dimension sizes before touching self.dims
+        new_dims = {}
+        for arr in arrays.values():
+            for dim, size in arr.infer_dims_from_data().items():
+                known = new_dims.get(dim, self.dims.get(dim, size))
+                if known != size:
+                    raise ValueError(f"Dimension mismatch for '{dim}': existing={known} new={size}")
+                new_dims[dim] = size
+
+        # Record operation (don't store actual data)
+        args = {}
+        added = []
+        modified = {}
+        for name, spec in variables.items():
+            args[name], changes = _array_record(
+                self.variables,
+                name,
+                spec.get("dims"),
+                spec.get("attrs"),
+                spec.get("data"),
+                spec.get("encoding"),
+            )
+            if changes is None:
+                added.append(name)
+            elif changes:
+                modified[name] = changes
+
+        provenance = {}
+        if added:
+            provenance["added"] = added
+        if modified:
+            provenance["modified"] = modified
+        self._record_operation("add_variables", {"variables": args}, provenance)
+
+        self.dims.update(new_dims)
+        self.variables.update(arrays)
+
     def rename_dims(self, dims_dict=None, **dims):
         """
         Rename dimensions (xarray-compatible API).
@@ -594,20 +755,32 @@ class DummyDataset(
         self._record_operation("rename_dims", {"dims_dict": name_dict}, provenance)
 
         # Perform all renames
+        effective = {}
         for old_name, new_name in name_dict.items():
             if old_name != new_name:
                 self.dims[new_name] = self.dims.pop(old_name)
+                effective[old_name] = new_name
 
-                # Update dimension references in coords and variables
-                for coord in self.coords.values():
-                    if coord.dims:
-                        coord.dims = [new_name if d == old_name else d for d in coord.dims]
-                for var in self.variables.values():
-                    if var.dims:
-                        var.dims = [new_name if d == old_name else d for d in var.dims]
+        # Update dimension references in coords and variables
+        self._rename_dim_references(effective)
 
         return self
 
+    def _rename_dim_references(self, mapping):
+        """
+        Rewrite dimension names of all coords and variables in one pass.
+
+        Parameters
+        ----------
+        mapping : dict
+            Old dimension names mapped to new ones
+        """
+        if not mapping:
+            return
+        for arr in chain(self.coords.values(), self.variables.values()):
+            if arr.dims and any(d in mapping for d in arr.dims):
+                arr.dims = [mapping.get(d, d) for d in arr.dims]
+
     def rename_vars(self, name_dict=None, **names):
         """
         Rename variables (xarray-compatible API).
@@ -651,12 +824,15 @@ class DummyDataset(
         if not rename_dict:
             raise ValueError("Either name_dict or keyword arguments must be provided")
 
-        # Validate all renames first
+        # Validate all renames first, keeping only those that change a name
+        effective = {}
         for old_name, new_name in rename_dict.items():
             if old_name not in self.variables:
                 raise KeyError(f"Variable '{old_name}' does not exist")
-            if new_name in self.variables and new_name != old_name:
-                raise ValueError(f"Variable '{new_name}' already exists")
+            if old_name != new_name:
+                if new_name in self.variables:
+                    raise ValueError(f"Variable '{new_name}' already exists")
+                effective[old_name] = new_name
 
         # Capture provenance
         provenance = {
@@ -668,9 +844,8 @@ class DummyDataset(
         self._record_operation("rename_vars", {"name_dict": rename_dict}, provenance)
 
         # Perform all renames
-        for old_name, new_name in rename_dict.items():
-            if old_name != new_name:
-                self.variables[new_name] = self.variables.pop(old_name)
+        for old_name, new_name in effective.items():
+            self.variables[new_name] = self.variables.pop(old_name)
 
         return self
 
@@ -727,23 +902,32 @@ class DummyDataset(
         var_renames = {}
 
         for old_name, new_name in rename_dict.items():
-            if old_name in self.dims:
-                dim_renames[old_name] = new_name
-            if old_name in self.coords:
-                coord_renames[old_name] = new_name
-            if old_name in self.variables:
-                var_renames[old_name] = new_name
+            in_dims = old_name in self.dims
+            in_coords = old_name in self.coords
+            in_vars = old_name in self.variables
 
             # Check if name exists anywhere
-            if (
-                old_name not in self.dims
-                and old_name not in self.coords
-                and old_name not in self.variables
-            ):
+            if not (in_dims or in_coords or in_vars):
                 raise KeyError(
                     f"'{old_name}' does not exist in dimensions, coordinates, or variables"
                 )
 
+            # Identity renames are recorded but need no further work
+            if old_name == new_name:
+                continue
+            if in_dims:
+                if new_name in self.dims:
+                    raise ValueError(f"Dimension '{new_name}' already exists")
+                dim_renames[old_name] = new_name
+            if in_coords:
+                if new_name in self.coords:
+                    raise ValueError(f"Coordinate '{new_name}' already exists")
+                coord_renames[old_name] = new_name
+            if in_vars:
+                if new_name in self.variables:
+                    raise ValueError(f"Variable '{new_name}' already exists")
+                var_renames[old_name] = new_name
+
         # Capture provenance
         provenance = {
             "renamed": rename_dict.copy(),
@@ -753,28 +937,19 @@ class DummyDataset(
 
         self._record_operation("rename", {"name_dict": rename_dict}, provenance)
 
-        # Perform renames in order: dimensions first (affects coords/vars), then coords, then vars
+        # Perform renames in order: dimensions first (affects coords/vars), then coords, then vars.
+        # Every name was checked above, so each pop is guaranteed to succeed.
         if dim_renames:
             for old_name, new_name in dim_renames.items():
-                if old_name != new_name and old_name in self.dims:
-                    self.dims[new_name] = self.dims.pop(old_name)
-                    # Update dimension references
-                    for coord in self.coords.values():
-                        if coord.dims:
-                            coord.dims = [new_name if d == old_name else d for d in coord.dims]
-                    for var in self.variables.values():
-                        if var.dims:
-                            var.dims = [new_name if d == old_name else d for d in var.dims]
-
-        if coord_renames:
-            for old_name, new_name in coord_renames.items():
-                if old_name != new_name and old_name in self.coords:
-                    self.coords[new_name] = self.coords.pop(old_name)
-
-        if var_renames:
-            for old_name, new_name in var_renames.items():
-                if old_name != new_name and old_name in self.variables:
-                    self.variables[new_name] = self.variables.pop(old_name)
+                self.dims[new_name] = self.dims.pop(old_name)
+            # Update dimension references
+            self._rename_dim_references(dim_renames)
+
+        for old_name, new_name in coord_renames.items():
+            self.coords[new_name] = self.coords.pop(old_name)
+
+        for old_name, new_name in var_renames.items():
+            self.variables[new_name] = self.variables.pop(old_name)
 
         return self
 
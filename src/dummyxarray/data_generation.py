@@ -5,13 +5,72 @@ This module provides mixins for populating datasets with meaningful
 random data based on metadata hints.
 """
 
+import os
+import re
+from functools import lru_cache
+from math import prod
+
 import numpy as np
 
+# Total number of variable elements above which sampling is spread over threads
+_PARALLEL_MIN_SIZE = 1_000_000
+
+# Substring pattern for vertical level coordinates
+_LEVEL_RE = re.compile("lev|level|plev|height|depth")
+
+# Substring patterns classifying variables, checked in this order
+_TEMPERATURE_RE = re.compile("temperature|temp|tas|ts")
+_PRESSURE_RE = re.compile("pressure|pres|psl")
+_PRECIPITATION_RE = re.compile("precipitation|precip|rain")
+_WIND_RE = re.compile("wind|velocity")
+_HUMIDITY_RE = re.compile("humidity|moisture|rh")
+_RADIATION_RE = re.compile("radiation|flux")
+# Wind components (u/zonal/eastward or v/meridional/northward)
+_WIND_COMPONENT_RE = re.compile("u|zonal|eastward|v|meridional|northward")
+
+
+def _encoded_dtype(encoding, kinds):
+    """Return the encoding's "dtype" if its kind is in ``kinds``, else None."""
+    dtype = encoding.get("dtype") if encoding else None
+    if dtype is None:
+        return None
+    try:
+        dtype = np.dtype(dtype)
+    except TypeError:
+        return None
+    return dtype if dtype.kind in kinds else None
+
+
+def _sample_dtype(encoding):
+    """Return the float dtype to draw samples in for an array's encoding."""
+    # Generator methods can only produce float32 or float64 directly
+    if _encoded_dtype(encoding, "f") == np.float32:
+        return np.float32
+    return np.float64
+
+
+@lru_cache(maxsize=256)
+def _cached_linspace(start, stop, size, dtype):
+    """Return a read-only np.linspace result shared between calls."""
+    values = np.linspace(start, stop, size, dtype=dtype)
+    values.flags.writeable = False
+    return values
+
+
+def _uniform(rng, low, high, shape, dtype):
+    """Draw uniform samples between low and high in the given dtype."""
+    out = rng.random(shape, dtype=dtype)
+    out *= high - low
+    out += low
+    return out
+
 
 class DataGenerationMixin:
     """Mixin providing data generation capabilities."""
 
-    def populate_with_random_data(self, seed=None):
+    __slots__ = ()
+
+    def populate_with_random_data(self, seed=None, fill="random"):
         """
         Populate all variables and coordinates with random but meaningful data.
 
@@ -21,7 +80,13 @@ class DataGenerationMixin:
         Parameters
         ----------
         seed : int, optional
-            Random seed for reproducibility
+            Seed for the ``numpy.random.SeedSequence`` from which one generator
+            per variable is spawned. Pass it for reproducible results.
+        fill : {"random", "zeros", "empty"}, default "random"
+            How to fill variables. "random" draws values from metadata hints;
+            "zeros" and "empty" only allocate arrays of the right shape, which
+            is much faster when the values are never read (e.g. to test chunk
+            layouts). Coordinates always get meaningful values.
 
         Returns
         -------
@@ -40,130 +105,152 @@ class DataGenerationMixin:
         >>> print(ds.coords["time"].data)
         [0 1 2 3 4 5 6 7 8 9]
         """
-        if seed is not None:
-            np.random.seed(seed)
+        if fill not in ("random", "zeros", "empty"):
+            raise ValueError(f"Unknown fill mode: {fill!r}")
 
         # Populate coordinates
         for coord_name, coord_array in self.coords.items():
             if coord_array.data is None:
                 coord_array.data = self._generate_coordinate_data(coord_name, coord_array)
 
-        # Populate variables
-        for var_name, var_array in self.variables.items():
-            if var_array.data is None:
-                var_array.data = self._generate_variable_data(var_name, var_array)
+        # Populate variables, each from its own generator so the result does
+        # not depend on the order in which they are drawn
+        pending = [(name, arr) for name, arr in self.variables.items() if arr.data is None]
+        rngs = [np.random.default_rng(s) for s in np.random.SeedSequence(seed).spawn(len(pending))]
+
+        def generate(item):
+            (name, arr), rng = item
+            return self._generate_variable_data(name, arr, rng, fill)
+
+        items = list(zip(pending, rngs, strict=True))
+        total_size = sum(prod(self.dims[d] for d in arr.dims) for _, arr in pending)
+        workers = min(len(items), os.cpu_count() or 1)
+        if fill == "random" and workers > 1 and total_size >= _PARALLEL_MIN_SIZE:
+            # NumPy releases the GIL while sampling large arrays
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(generate, items))
+        else:
+            results = [generate(item) for item in items]
+
+        for (_, arr), data in zip(pending, results, strict=True):
+            arr.data = data
 
         return self
 
     def _generate_coordinate_data(self, name, array):
         """Generate meaningful coordinate data based on metadata."""
-        shape = tuple(self.dims[d] for d in array.dims)
-        size = shape[0] if shape else 1
+        size = self.dims[array.dims[0]] if array.dims else 1
+
+        # Generate in the encoded dtype when it can hold the values, so that
+        # no cast is needed on write; otherwise keep NumPy's defaults
+        dtype = _encoded_dtype(array.encoding, "iuf")
+        # The largest value np.arange generates is size - 1
+        if dtype is not None and dtype.kind != "f" and size - 1 > np.iinfo(dtype).max:
+            dtype = None
+        float_dtype = _encoded_dtype(array.encoding, "f")
 
         # Check standard_name or units for hints
-        standard_name = array.attrs.get("standard_name", "").lower()
-        units = array.attrs.get("units", "").lower()
+        attrs = array.attrs
+        standard_name = attrs.get("standard_name", "").lower()
+        units = attrs.get("units", "").lower()
+        name_lower = name.lower()
 
         # Time coordinates
-        if "time" in name.lower() or "time" in standard_name:
-            return np.arange(size)
+        if "time" in name_lower or "time" in standard_name:
+            return np.arange(size, dtype=dtype)
 
         # Latitude coordinates
-        if "lat" in name.lower() or "latitude" in standard_name:
-            return np.linspace(-90, 90, size)
+        if "lat" in name_lower or "latitude" in standard_name:
+            return _cached_linspace(-90, 90, size, float_dtype).copy()
 
         # Longitude coordinates
-        if "lon" in name.lower() or "longitude" in standard_name:
-            return np.linspace(-180, 180, size)
+        if "lon" in name_lower or "longitude" in standard_name:
+            return _cached_linspace(-180, 180, size, float_dtype).copy()
 
         # Vertical levels (pressure, height, etc.)
-        if any(x in name.lower() for x in ["lev", "level", "plev", "height", "depth"]):
+        if _LEVEL_RE.search(name_lower):
             if "pressure" in units or "hpa" in units or "pa" in units:
                 # Pressure levels (high to low)
-                return np.linspace(1000, 100, size)
+                return _cached_linspace(1000, 100, size, float_dtype).copy()
             else:
                 # Generic levels
-                return np.arange(size)
+                return np.arange(size, dtype=dtype)
 
         # Default: sequential integers
-        return np.arange(size)
+        return np.arange(size, dtype=dtype)
 
-    def _generate_variable_data(self, name, array):
+    def _generate_variable_data(self, name, array, rng, fill="random"):
         """Generate meaningful variable data based on metadata."""
         shape = tuple(self.dims[d] for d in array.dims)
+        # Sample directly in a float32 target encoding to skip a later cast
+        dtype = _sample_dtype(array.encoding)
+
+        # Shape-only fills skip classification and sampling entirely
+        if fill == "zeros":
+            return np.zeros(shape, dtype)
+        if fill == "empty":
+            return np.empty(shape, dtype)
 
         # Get metadata hints
-        standard_name = array.attrs.get("standard_name", "").lower()
-        units = array.attrs.get("units", "").lower()
-        long_name = array.attrs.get("long_name", "").lower()
+        attrs = array.attrs
+        standard_name = attrs.get("standard_name", "").lower()
+        units = attrs.get("units", "").lower()
+        long_name = attrs.get("long_name", "").lower()
+        name_lower = name.lower()
+        # One string to search all three fields at once; the separator keeps
+        # patterns from matching across field boundaries
+        hints = f"{standard_name}\n{name_lower}\n{long_name}"
 
         # Temperature variables
-        if any(
-            x in standard_name or x in name.lower() or x in long_name
-            for x in ["temperature", "temp", "tas", "ts"]
-        ):
+        if _TEMPERATURE_RE.search(hints):
             if "k" == units or "kelvin" in units:
                 # Temperature in Kelvin (250-310K range)
-                return np.random.uniform(250, 310, shape)
+                return _uniform(rng, 250, 310, shape, dtype)
             elif "c" == units or "celsius" in units or "degc" in units:
                 # Temperature in Celsius (-30 to 40C range)
-                return np.random.uniform(-30, 40, shape)
+                return _uniform(rng, -30, 40, shape, dtype)
             else:
-                return np.random.uniform(250, 310, shape)
+                return _uniform(rng, 250, 310, shape, dtype)
 
         # Pressure variables (check before precipitation to avoid "pr" conflict)
-        if any(
-            x in standard_name or x in name.lower() or x in long_name
-            for x in ["pressure", "pres", "psl"]
-        ):
-            if "sea_level" in standard_name or "msl" in name.lower() or "psl" in name.lower():
+        if _PRESSURE_RE.search(hints):
+            if "sea_level" in standard_name or "msl" in name_lower or "psl" in name_lower:
                 # Sea level pressure (980-1040 hPa)
-                return np.random.uniform(98000, 104000, shape)
+                return _uniform(rng, 98000, 104000, shape, dtype)
             else:
                 # Generic pressure
-                return np.random.uniform(50000, 105000, shape)
+                return _uniform(rng, 50000, 105000, shape, dtype)
 
         # Precipitation variables
-        if (
-            any(
-                x in standard_name or x in name.lower() or x in long_name
-                for x in ["precipitation", "precip", "rain"]
-            )
-            or name.lower() == "pr"
-        ):
+        if _PRECIPITATION_RE.search(hints) or name_lower == "pr":
             # Precipitation (always positive, skewed distribution)
-            return np.random.exponential(0.001, shape)
+            out = rng.standard_exponential(shape, dtype=dtype)
+            out *= 0.001
+            return out
 
         # Wind variables
-        if any(
-            x in standard_name or x in name.lower() or x in long_name for x in ["wind", "velocity"]
-        ):
+        if _WIND_RE.search(hints):
             # Wind speed (0-30 m/s, can be negative for components)
-            if any(x in name.lower() for x in ["u", "zonal", "eastward"]):
-                return np.random.uniform(-20, 20, shape)
-            elif any(x in name.lower() for x in ["v", "meridional", "northward"]):
-                return np.random.uniform(-20, 20, shape)
+            if _WIND_COMPONENT_RE.search(name_lower):
+                return _uniform(rng, -20, 20, shape, dtype)
             else:
-                return np.random.uniform(0, 30, shape)
+                return _uniform(rng, 0, 30, shape, dtype)
 
         # Humidity variables
-        if any(
-            x in standard_name or x in name.lower() or x in long_name
-            for x in ["humidity", "moisture", "rh"]
-        ):
+        if _HUMIDITY_RE.search(hints):
             if "relative" in standard_name or "relative" in long_name:
                 # Relative humidity (0-100%)
-                return np.random.uniform(20, 100, shape)
+                return _uniform(rng, 20, 100, shape, dtype)
             else:
                 # Specific humidity (small positive values)
-                return np.random.uniform(0, 0.02, shape)
+                return _uniform(rng, 0, 0.02, shape, dtype)
 
         # Radiation variables
-        if any(
-            x in standard_name or x in name.lower() or x in long_name for x in ["radiation", "flux"]
-        ):
+        if _RADIATION_RE.search(hints):
             # Radiation (positive values, 0-1000 W/m²)
-            return np.random.uniform(0, 1000, shape)
+            return _uniform(rng, 0, 1000, shape, dtype)
 
         # Default: standard normal distribution
-        return np.random.randn(*shape)
+        return rng.standard_normal(shape, dtype=dtype)
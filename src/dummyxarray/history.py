@@ -6,13 +6,52 @@ operation history.
 """
 
 import json
+from collections import Counter, deque
+from itertools import islice
 
-import yaml
+# Node fill colors for DOT visualization, keyed by operation name
+_OP_COLOR = {
+    "__init__": "lightblue",
+    "add_dim": "lightgreen",
+    "add_coord": "lightyellow",
+    "add_variable": "lightcoral",
+    "add_variables": "lightcoral",
+    "assign_attrs": "lavender",
+    "populate_with_random_data": "lightpink",
+}
+
+
+class _Op:
+    """A recorded operation: function name, arguments and optional provenance."""
+
+    __slots__ = ("args", "func", "provenance")
+
+    def __init__(self, func, args, provenance=None):
+        self.func = func
+        self.args = args
+        self.provenance = provenance
+
+    def to_dict(self, include_provenance=True):
+        """Return the public dict form of this operation."""
+        entry = {"func": self.func, "args": self.args}
+        if include_provenance and self.provenance:
+            entry["provenance"] = self.provenance
+        return entry
+
+
+def _python_line(op):
+    """Format a recorded operation as a line of Python code."""
+    if op.func == "__init__":
+        return "ds = DummyDataset()"
+    args_str = ", ".join(f"{k}={v!r}" for k, v in op.args.items())
+    return f"ds.{op.func}({args_str})"
 
 
 class HistoryMixin:
     """Mixin providing history tracking and visualization capabilities."""
 
+    __slots__ = ()
+
     def _record_operation(self, func_name, args, provenance=None):
         """
         Record an operation in the history with provenance information.
@@ -31,10 +70,15 @@ class HistoryMixin:
             - 'modified': dict of items modified with before/after values
         """
         if self._history is not None:
-            entry = {"func": func_name, "args": args}
-            if provenance:
-                entry["provenance"] = provenance
-            self._history.append(entry)
+            self._history.append(_Op(func_name, args, provenance or None))
+
+    def _iter_history(self):
+        """
+        Return the recorded operations without copying.
+
+        For internal read-only use; callers must not mutate the result.
+        """
+        return self._history or []
 
     def get_history(self, include_provenance=True):
         """
@@ -65,11 +109,7 @@ class HistoryMixin:
         if self._history is None:
             return []
 
-        if include_provenance:
-            return self._history.copy()
-        else:
-            # Return history without provenance information
-            return [{"func": op["func"], "args": op["args"]} for op in self._history]
+        return [op.to_dict(include_provenance) for op in self._history]
 
     def export_history(self, format="json"):
         """
@@ -93,21 +133,16 @@ class HistoryMixin:
         ds = DummyDataset()
         ds.add_dim(name='time', size=10)
         """
-        history = self.get_history()
+        history = self._iter_history()
 
         if format == "json":
-            return json.dumps(history, indent=2)
+            return json.dumps([op.to_dict() for op in history], indent=2)
         elif format == "yaml":
-            return yaml.dump(history, default_flow_style=False)
+            import yaml
+
+            return yaml.dump([op.to_dict() for op in history], default_flow_style=False)
         elif format == "python":
-            lines = []
-            for op in history:
-                if op["func"] == "__init__":
-                    lines.append("ds = DummyDataset()")
-                else:
-                    args_str = ", ".join(f"{k}={repr(v)}" for k, v in op["args"].items())
-                    lines.append(f"ds.{op['func']}({args_str})")
-            return "\n".join(lines)
+            return "\n".join(_python_line(op) for op in history)
         else:
             raise ValueError(f"Unknown format: {format}. Use 'json', 'yaml', or 'python'")
 
@@ -138,16 +173,16 @@ class HistoryMixin:
             try:
                 history = json.loads(history)
             except json.JSONDecodeError:
+                import yaml
+
                 history = yaml.safe_load(history)
 
         # Create new dataset without recording
         ds = cls(_record_history=False)
 
-        # Replay operations (skip __init__)
-        for op in history:
-            if op["func"] == "__init__":
-                continue
-
+        # Replay operations (skip __init__, which is always recorded first)
+        start = 1 if history and history[0]["func"] == "__init__" else 0
+        for op in islice(history, start, None):
             func = getattr(ds, op["func"], None)
             if func and callable(func):
                 func(**op["args"])
@@ -173,7 +208,10 @@ class HistoryMixin:
         >>> # History only shows changes after reset
         >>> print(ds.visualize_history())
         """
-        self._history = []
+        # Keep any history_maxlen bound given at construction
+        self._history = deque(maxlen=getattr(self._history, "maxlen", None))
+        # Drop provenance cached for the old history (see ProvenanceMixin)
+        self._prov_cache = None
         self._record_operation("__init__", {})
 
     def visualize_history(self, format="text", **kwargs):
@@ -209,7 +247,7 @@ class HistoryMixin:
         >>> print(ds.visualize_history(format='dot'))
         digraph dataset_history { ... }
         """
-        history = self.get_history()
+        history = self._iter_history()
         show_args = kwargs.get("show_args", True)
         compact = kwargs.get("compact", False)
 
@@ -227,34 +265,28 @@ class HistoryMixin:
         if not history:
             return "No operations recorded"
 
+        # Bind lookups used per operation to locals
+        join = ", ".join
+        lines = [] if compact else ["Dataset Construction History", "=" * 28, ""]
+        append = lines.append
+        for i, op in enumerate(history, 1):
+            args = op.args
+            if show_args and args:
+                args_str = join(f"{k}={v!r}" for k, v in args.items())
+                append(f"{i}. {op.func}({args_str})")
+            else:
+                append(f"{i}. {op.func}()")
+
         if compact:
-            lines = []
-            for i, op in enumerate(history, 1):
-                if show_args and op["args"]:
-                    args_str = ", ".join(f"{k}={repr(v)}" for k, v in op["args"].items())
-                    lines.append(f"{i}. {op['func']}({args_str})")
-                else:
-                    lines.append(f"{i}. {op['func']}()")
             return "\n".join(lines)
         else:
-            lines = ["Dataset Construction History", "=" * 28, ""]
-
-            for i, op in enumerate(history, 1):
-                if show_args and op["args"]:
-                    args_str = ", ".join(f"{k}={repr(v)}" for k, v in op["args"].items())
-                    lines.append(f"{i}. {op['func']}({args_str})")
-                else:
-                    lines.append(f"{i}. {op['func']}()")
-
             # Add summary
             lines.append("")
             lines.append("Summary:")
             lines.append(f"  Total operations: {len(history)}")
 
             # Count operation types
-            op_counts = {}
-            for op in history:
-                op_counts[op["func"]] = op_counts.get(op["func"], 0) + 1
+            op_counts = Counter(op.func for op in history)
 
             lines.append("  Operation breakdown:")
             for func, count in sorted(op_counts.items()):
@@ -272,17 +304,20 @@ class HistoryMixin:
         ]
 
         # Create nodes for each operation
+        join = "\\n".join
+        append = lines.append
         for i, op in enumerate(history):
-            label = op["func"]
-            if show_args and op["args"]:
-                args_str = "\\n".join(f"{k}={repr(v)}" for k, v in list(op["args"].items())[:3])
-                if len(op["args"]) > 3:
+            label = op.func
+            args = op.args
+            if show_args and args:
+                args_str = join(f"{k}={v!r}" for k, v in islice(args.items(), 3))
+                if len(args) > 3:
                     args_str += "\\n..."
                 label = f"{label}\\n{args_str}"
 
             # Color code by operation type
-            color = self._get_operation_color(op["func"])
-            lines.append(f'  op{i} [label="{label}", fillcolor="{color}", style=filled];')
+            color = _OP_COLOR.get(op.func, "lightgray")
+            append(f'  op{i} [label="{label}", fillcolor="{color}", style=filled];')
 
         # Create edges
         for i in range(len(history) - 1):
@@ -297,17 +332,18 @@ class HistoryMixin:
 
         # Create nodes for each operation
         for i, op in enumerate(history):
-            label = op["func"]
-            if show_args and op["args"]:
-                args_str = "<br/>".join(f"{k}={repr(v)}" for k, v in list(op["args"].items())[:2])
-                if len(op["args"]) > 2:
+            label = op.func
+            args = op.args
+            if show_args and args:
+                args_str = "<br/>".join(f"{k}={v!r}" for k, v in islice(args.items(), 2))
+                if len(args) > 2:
                     args_str += "<br/>..."
                 label = f"{label}<br/>{args_str}"
 
             # Use different shapes for different operations
-            if op["func"] == "__init__":
+            if op.func == "__init__":
                 lines.append(f'  op{i}["{label}"]')
-            elif op["func"].startswith("add_"):
+            elif op.func.startswith("add_"):
                 lines.append(f'  op{i}("{label}")')
             else:
                 lines.append(f'  op{i}["{label}"]')
@@ -317,15 +353,3 @@ class HistoryMixin:
             lines.append(f"  op{i} --> op{i+1}")
 
         return "\n".join(lines)
-
-    def _get_operation_color(self, func_name):
-        """Get color for operation type."""
-        color_map = {
-            "__init__": "lightblue",
-            "add_dim": "lightgreen",
-            "add_coord": "lightyellow",
-            "add_variable": "lightcoral",
-            "assign_attrs": "lavender",
-            "populate_with_random_data": "lightpink",
-        }
-        return color_map.get(func_name, "lightgray")
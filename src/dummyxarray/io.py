@@ -10,8 +10,6 @@ import uuid
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, TypeVar, Union
 
-import yaml
-
 if TYPE_CHECKING:
     from pystac import Collection
 
@@ -21,9 +19,38 @@ if TYPE_CHECKING:
 D = TypeVar("D", bound="DummyDataset")
 
 
+# Line width passed to the YAML emitters; large enough never to fold scalars
+_YAML_WIDTH = 2**31 - 1
+
+
+def _yaml_dump(data, stream=None):
+    """
+    Dump ``data`` as YAML, keeping key order.
+
+    PyYAML is imported on first use, and its libyaml-backed emitter is
+    used when PyYAML was built with it. Long scalars are never folded: the
+    two emitters fold them at different points, so pinning the width keeps
+    the output identical whichever one is used.
+    """
+    import yaml
+
+    dumper = getattr(yaml, "CDumper", yaml.Dumper)
+    return yaml.dump(data, stream, Dumper=dumper, sort_keys=False, width=_YAML_WIDTH)
+
+
+def _yaml_safe_load(stream):
+    """Safely load YAML, using the libyaml-backed parser when available."""
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(stream, Loader=loader)
+
+
 class IOMixin:
     """Mixin providing I/O capabilities."""
 
+    __slots__ = ()
+
     def to_dict(self):
         """
         Export dataset structure to a dictionary.
@@ -47,7 +74,9 @@ class IOMixin:
         Parameters
         ----------
         **kwargs
-            Additional arguments passed to json.dumps
+            Additional arguments passed to json.dumps. Output is indented
+            by 2 spaces unless ``indent`` is given; ``indent=None`` produces
+            compact output through the faster C encoder.
 
         Returns
         -------
@@ -59,6 +88,25 @@ class IOMixin:
             kwargs["indent"] = 2
         return json.dumps(self.to_dict(), **kwargs)
 
+    def save_json(self, path, **kwargs):
+        """
+        Save dataset specification to a JSON file.
+
+        The JSON is written to the file as it is encoded, without building
+        the whole string in memory first.
+
+        Parameters
+        ----------
+        path : str
+            Output file path
+        **kwargs
+            Additional arguments passed to json.dump, as for :meth:`to_json`
+        """
+        if "indent" not in kwargs:
+            kwargs["indent"] = 2
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, **kwargs)
+
     def to_yaml(self):
         """
         Export dataset structure to YAML string.
@@ -68,7 +116,7 @@ class IOMixin:
         str
             YAML representation
         """
-        return yaml.dump(self.to_dict(), sort_keys=False)
+        return _yaml_dump(self.to_dict())
 
     def save_yaml(self, path):
         """
@@ -80,7 +128,7 @@ class IOMixin:
             Output file path
         """
         with open(path, "w") as f:
-            f.write(self.to_yaml())
+            _yaml_dump(self.to_dict(), f)
 
     @classmethod
     def load_yaml(cls, path):
@@ -101,28 +149,32 @@ class IOMixin:
         from .core import DummyArray
 
         with open(path) as f:
-            spec = yaml.safe_load(f)
+            spec = _yaml_safe_load(f)
 
         ds = cls()
 
         ds.dims.update(spec.get("dimensions", {}))
 
-        for name, info in spec.get("coordinates", {}).items():
-            ds.coords[name] = DummyArray(
-                dims=info["dims"], attrs=info["attrs"], data=None, encoding=info.get("encoding", {})
+        # Loaded arrays carry no per-array history, as with add_coord/add_variable
+        ds.coords = {
+            name: DummyArray(
+                info["dims"], info["attrs"], None, info.get("encoding", {}), _record_history=False
             )
-
-        for name, info in spec.get("variables", {}).items():
-            ds.variables[name] = DummyArray(
-                dims=info["dims"], attrs=info["attrs"], data=None, encoding=info.get("encoding", {})
+            for name, info in spec.get("coordinates", {}).items()
+        }
+        ds.variables = {
+            name: DummyArray(
+                info["dims"], info["attrs"], None, info.get("encoding", {}), _record_history=False
             )
+            for name, info in spec.get("variables", {}).items()
+        }
 
         ds.attrs.update(spec.get("attrs", {}))
 
         return ds
 
     @classmethod
-    def from_xarray(cls, xr_dataset, include_data=False):
+    def from_xarray(cls, xr_dataset, include_data=False, lazy=False):
         """
         Create a DummyDataset from an existing xarray.Dataset.
 
@@ -137,6 +189,9 @@ class IOMixin:
         include_data : bool, default False
             If True, include the actual data arrays. If False, only capture
             metadata structure.
+        lazy : bool, default False
+            With include_data, keep each variable's underlying array (e.g. a
+            dask array) instead of loading it into memory with ``.values``.
 
         Returns
         -------
@@ -163,26 +218,27 @@ class IOMixin:
         ds.attrs.update(dict(xr_dataset.attrs))
 
         # Extract dimensions
-        for dim_name, dim_size in xr_dataset.sizes.items():
-            ds.dims[dim_name] = dim_size
-
-        # Extract coordinates
-        for coord_name, coord_var in xr_dataset.coords.items():
-            ds.coords[coord_name] = DummyArray(
-                dims=list(coord_var.dims),
-                attrs=dict(coord_var.attrs),
-                data=coord_var.values if include_data else None,
-                encoding=dict(coord_var.encoding) if hasattr(coord_var, "encoding") else {},
+        ds.dims.update(xr_dataset.sizes)
+
+        def _to_dummy(var):
+            if not include_data:
+                data = None
+            elif lazy:
+                # Underlying (possibly dask) array, left uncomputed
+                data = var.data
+            else:
+                data = var.values
+            return DummyArray(
+                list(var.dims),
+                dict(var.attrs),
+                data,
+                dict(getattr(var, "encoding", {})),
+                _record_history=False,
             )
 
-        # Extract data variables
-        for var_name, var in xr_dataset.data_vars.items():
-            ds.variables[var_name] = DummyArray(
-                dims=list(var.dims),
-                attrs=dict(var.attrs),
-                data=var.values if include_data else None,
-                encoding=dict(var.encoding) if hasattr(var, "encoding") else {},
-            )
+        # Extract coordinates and data variables
+        ds.coords = {name: _to_dummy(var) for name, var in xr_dataset.coords.items()}
+        ds.variables = {name: _to_dummy(var) for name, var in xr_dataset.data_vars.items()}
 
         return ds
 
@@ -210,29 +266,22 @@ class IOMixin:
         if validate:
             self.validate(strict_coords=False)
 
+        # Encodings travel in the (dims, data, attrs, encoding) tuples, so no
+        # second pass over the built Dataset is needed to apply them
         coords = {}
         for name, arr in self.coords.items():
             if arr.data is None:
                 raise ValueError(f"Coordinate '{name}' missing data.")
-            coords[name] = (arr.dims, arr.data, arr.attrs)
+            coords[name] = (arr.dims, arr.data, arr.attrs, arr.encoding)
 
         variables = {}
         for name, arr in self.variables.items():
             if arr.data is None:
                 raise ValueError(f"Variable '{name}' missing data.")
-            variables[name] = (arr.dims, arr.data, arr.attrs)
+            variables[name] = (arr.dims, arr.data, arr.attrs, arr.encoding)
 
         ds = xr.Dataset(data_vars=variables, coords=coords, attrs=self.attrs)
 
-        # Apply encodings
-        for name, arr in self.variables.items():
-            if arr.encoding:
-                ds[name].encoding = arr.encoding
-
-        for name, arr in self.coords.items():
-            if arr.encoding:
-                ds[name].encoding = arr.encoding
-
         return ds
 
     def to_zarr(self, store_path, mode="w", validate=True):
@@ -368,7 +417,7 @@ class IOMixin:
         sources[name] = source_entry
         catalog["sources"] = sources
 
-        return yaml.dump(catalog, sort_keys=False)
+        return _yaml_dump(catalog)
 
     def save_intake_catalog(
         self,
@@ -441,14 +490,12 @@ class IOMixin:
         """
         from pathlib import Path
 
-        import yaml
-
         # Load catalog
         if isinstance(catalog_source, (str, Path)):
             # Load from file
             try:
                 with open(catalog_source) as f:
-                    catalog = yaml.safe_load(f)
+                    catalog = _yaml_safe_load(f)
             except FileNotFoundError as err:
                 raise FileNotFoundError(f"Catalog file not found: {catalog_source}") from err
         elif isinstance(catalog_source, dict):
@@ -15,6 +15,8 @@ class FileTrackerMixin:
     dimension (typically time).
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         """Initialize file tracking structures."""
         super().__init__(*args, **kwargs)
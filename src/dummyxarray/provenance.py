@@ -9,6 +9,11 @@ This module provides mixins for tracking and visualizing state changes
 class ProvenanceMixin:
     """Mixin providing provenance tracking capabilities."""
 
+    __slots__ = ()
+
+    # (history, last op, length, result) of the last all-operations call
+    _prov_cache = None
+
     def get_provenance(self, operation_index=None):
         """
         Get provenance information showing what changed in each operation.
@@ -33,24 +38,40 @@ class ProvenanceMixin:
         >>> prov[2]['provenance']['modified']['units']
         {'before': 'degC', 'after': 'K'}
         """
-        history = self.get_history(include_provenance=True)
+        history = self._iter_history()
 
         if operation_index is not None:
             if 0 <= operation_index < len(history):
-                return history[operation_index].get("provenance", {})
+                return history[operation_index].provenance or {}
             else:
                 raise IndexError(f"Operation index {operation_index} out of range")
 
+        # Reuse the previous result while no operation has been recorded.
+        # Recorded operations are never mutated once appended, so the history
+        # object, its length and its last entry identify its contents.
+        # Callers get fresh entry dicts, so changing one cannot alter the cache.
+        last = history[-1] if history else None
+        cache = self._prov_cache
+        if (
+            cache is not None
+            and cache[0] is history
+            and cache[1] is last
+            and cache[2] == len(history)
+        ):
+            return [dict(entry) for entry in cache[3]]
+
         # Return all provenance information
-        return [
+        result = [
             {
                 "index": i,
-                "func": op["func"],
-                "provenance": op.get("provenance", {}),
+                "func": op.func,
+                "provenance": op.provenance,
             }
             for i, op in enumerate(history)
-            if "provenance" in op
+            if op.provenance
         ]
+        self._prov_cache = (history, last, len(history), result)
+        return [dict(entry) for entry in result]
 
     def visualize_provenance(self, compact=False):
         """
@@ -84,14 +105,14 @@ class ProvenanceMixin:
           Modified attributes:
             units: 'degC' → 'K'
         """
-        history = self.get_history(include_provenance=True)
+        history = self._iter_history()
 
         if compact:
             lines = []
             for i, op in enumerate(history):
-                if "provenance" not in op:
+                prov = op.provenance
+                if not prov:
                     continue
-                prov = op["provenance"]
                 changes = []
                 if "renamed" in prov:
                     for old, new in prov["renamed"].items():
@@ -107,19 +128,19 @@ class ProvenanceMixin:
                         else:
                             changes.append(f"{key}: modified")
                 if changes:
-                    lines.append(f"{i}. {op['func']}: {'; '.join(changes)}")
+                    lines.append(f"{i}. {op.func}: {'; '.join(changes)}")
             return "\n".join(lines) if lines else "No changes recorded"
         else:
             lines = ["Provenance: Dataset Changes", "=" * 28, ""]
 
             has_changes = False
             for i, op in enumerate(history):
-                if "provenance" not in op:
+                prov = op.provenance
+                if not prov:
                     continue
 
                 has_changes = True
-                prov = op["provenance"]
-                lines.append(f"Operation {i}: {op['func']}")
+                lines.append(f"Operation {i}: {op.func}")
 
                 if "renamed" in prov:
                     lines.append("  Renamed:")
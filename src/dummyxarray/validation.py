@@ -4,12 +4,14 @@ Dataset validation for DummyDataset.
 This module provides mixins for validating dataset structure.
 """
 
-import numpy as np
+from itertools import chain
 
 
 class ValidationMixin:
     """Mixin providing dataset validation capabilities."""
 
+    __slots__ = ()
+
     def validate(self, strict_coords=False):
         """
         Validate the entire dataset structure.
@@ -25,32 +27,38 @@ class ValidationMixin:
             If validation fails
         """
         errors = []
+        shape_errors = []
 
-        # 1. Dimensions must be known
-        all_dims = set(self.dims.keys())
+        dims = self.dims
 
-        for name, arr in {**self.coords, **self.variables}.items():
-            if arr.dims is None:
+        # One pass checks that dimensions are known (1) and that data shapes
+        # match them (2); shape errors are still reported after dim errors
+        for name, arr in chain(self.coords.items(), self.variables.items()):
+            arr_dims = arr.dims
+            if arr_dims is None:
                 continue
-            for d in arr.dims:
-                if d not in all_dims:
+            known = True
+            for d in arr_dims:
+                if d not in dims:
                     errors.append(f"{name}: Unknown dimension '{d}'.")
+                    known = False
 
-        # 2. Data shapes must match dims
-        for name, arr in {**self.coords, **self.variables}.items():
-            if arr.data is not None and arr.dims is not None:
-                shape = np.asarray(arr.data).shape
-                dim_sizes = [self.dims[d] for d in arr.dims]
+            if arr.data is not None and known:
+                # Duck arrays report their own shape; only sequences are converted
+                shape = arr._shape
+                dim_sizes = [dims[d] for d in arr_dims]
                 if tuple(dim_sizes) != shape:
-                    errors.append(f"{name}: Data shape {shape} does not match dims {dim_sizes}.")
+                    shape_errors.append(
+                        f"{name}: Data shape {shape} does not match dims {dim_sizes}."
+                    )
+        errors.extend(shape_errors)
 
         # 3. Variables reference coords?
         if strict_coords:
-            coord_names = set(self.coords.keys())
             for name, arr in self.variables.items():
                 if arr.dims:
                     for d in arr.dims:
-                        if d not in coord_names:
+                        if d not in self.coords:
                             errors.append(f"{name}: Missing coordinate for dimension '{d}'.")
 
         if errors:
@@ -107,6 +107,15 @@ class TestAxisInference:
         assert axes["z"] == "Z"
         assert axes["t"] == "T"
 
+    def test_infer_axis_follows_attr_changes(self):
+        """Test that inference reflects attributes changed in place."""
+        ds = DummyDataset()
+        ds.add_coord("foo", dims=["foo"], attrs={"units": "degrees_east"})
+        assert ds.infer_axis()["foo"] == "X"
+
+        ds.coords["foo"].attrs["units"] = "degrees_north"
+        assert ds.infer_axis()["foo"] == "Y"
+
     def test_infer_axis_existing_axis_attr(self):
         """Test that existing axis attributes are preserved."""
         ds = DummyDataset()
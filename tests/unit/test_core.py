@@ -8,6 +8,19 @@ import pytest
 from dummyxarray import DummyArray, DummyDataset
 
 
+class LazyArray:
+    """Minimal duck array that counts conversions to NumPy, like a dask array"""
+
+    def __init__(self, shape, dtype="float32"):
+        self.shape = shape
+        self.dtype = np.dtype(dtype)
+        self.conversions = 0
+
+    def __array__(self, dtype=None, copy=None):
+        self.conversions += 1
+        return np.zeros(self.shape, dtype or self.dtype)
+
+
 class TestDummyArray:
     """Tests for DummyArray class"""
 
@@ -41,6 +54,37 @@ class TestDummyArray:
         assert arr.dims == ["dim_0", "dim_1", "dim_2"]
         assert inferred == {"dim_0": 3, "dim_1": 4, "dim_2": 5}
 
+    def test_validate_list_data_shape(self):
+        """Test validation checks shapes of list data"""
+        ds = DummyDataset()
+        ds.add_variable("test", dims=["time"], data=[1, 2, 3])
+        ds.validate()
+
+        ds.dims["time"] = 4
+        with pytest.raises(ValueError, match="Data shape"):
+            ds.validate()
+
+    def test_validate_list_data_mutated_in_place(self):
+        """Test validation sees list data changed in place"""
+        ds = DummyDataset()
+        ds.add_variable("v", dims=["t"], data=[1, 2, 3])
+        ds.validate()
+
+        ds.variables["v"].data.append(4)
+        assert "Shape: (4,)" in repr(ds.variables["v"])
+        with pytest.raises(ValueError, match=r"Data shape \(4,\) does not match dims \[3\]"):
+            ds.validate()
+
+    def test_infer_dims_from_lazy_data(self):
+        """Test dimension inference reads a duck array's shape without loading it"""
+        data = LazyArray((4, 3))
+        ds = DummyDataset()
+        ds.add_variable("v", dims=["t", "x"], data=data)
+        ds.validate()
+
+        assert ds.dims == {"t": 4, "x": 3}
+        assert data.conversions == 0
+
     def test_to_dict(self):
         """Test dictionary export"""
         arr = DummyArray(dims=["time"], attrs={"units": "days"}, data=np.array([1, 2, 3]))
@@ -71,6 +115,35 @@ class TestDummyArray:
         assert "dtype:" in repr_str
         assert "Data:" in repr_str
 
+    def test_repr_preview_non_contiguous(self):
+        """Test repr previews non-contiguous data in logical order"""
+        data = np.arange(20).reshape(4, 5).T
+        arr = DummyArray(dims=["x", "y"], data=data)
+
+        assert "Data: [0, 5, ..., 19]" in repr(arr)
+
+    def test_repr_after_data_reassignment(self):
+        """Test repr reflects reassigned list data"""
+        arr = DummyArray(dims=["time"], data=[1, 2, 3])
+        assert "Shape: (3,)" in repr(arr)
+
+        arr.data = [1.5, 2.5, 3.5, 4.5]
+        repr_str = repr(arr)
+        assert "Shape: (4,)" in repr_str
+        assert "dtype: float64" in repr_str
+
+    def test_pickle_roundtrip(self):
+        """Test that a DummyArray survives pickling"""
+        import pickle
+
+        arr = DummyArray(dims=["time"], attrs={"units": "K"}, data=[1, 2, 3])
+        restored = pickle.loads(pickle.dumps(arr))
+
+        assert restored.dims == ["time"]
+        assert restored.attrs == {"units": "K"}
+        assert restored.data == [1, 2, 3]
+        assert restored.get_history() == arr.get_history()
+
     def test_assign_attrs(self):
         """Test assign_attrs method for DummyArray"""
         arr = DummyArray(dims=["time"])
@@ -167,6 +240,62 @@ class TestDummyDataset:
         assert ds.variables["tas"].dims == ["time"]
         assert ds.variables["tas"].attrs["units"] == "K"
 
+    def test_add_variables(self):
+        """Test adding several variables at once"""
+        ds = DummyDataset()
+        ds.add_variables(
+            {
+                "tas": {"dims": ["time"], "attrs": {"units": "K"}, "data": np.zeros(4)},
+                "pr": {"dims": ["time", "lat"], "data": np.zeros((4, 3))},
+            }
+        )
+
+        assert ds.dims == {"time": 4, "lat": 3}
+        assert ds.variables["tas"].attrs["units"] == "K"
+        op = ds.get_history()[-1]
+        assert op["func"] == "add_variables"
+        assert op["args"]["variables"]["pr"] == {"dims": ["time", "lat"], "data": "<data>"}
+        assert op["provenance"] == {"added": ["tas", "pr"]}
+
+    def test_add_variables_records_like_add_variable(self):
+        """Test that add_variables records the same args and changes as add_variable"""
+        spec = {"dims": ["time"], "attrs": {"units": "degC"}, "data": np.zeros(4)}
+        single, bulk = DummyDataset(), DummyDataset()
+        for ds in (single, bulk):
+            ds.add_variable("tas", dims=["time"], attrs={"units": "K"}, data=np.zeros(4))
+        single.add_variable("tas", **spec)
+        bulk.add_variables({"tas": spec})
+
+        single_op, bulk_op = single.get_history()[-1], bulk.get_history()[-1]
+        assert bulk_op["args"]["variables"]["tas"] == {
+            k: v for k, v in single_op["args"].items() if k != "name"
+        }
+        assert bulk_op["provenance"] == single_op["provenance"]
+
+    def test_add_variables_replay(self):
+        """Test that add_variables is replayed from history"""
+        ds = DummyDataset()
+        ds.add_dim("time", 4)
+        ds.add_variables({"tas": {"dims": ["time"]}, "pr": {"dims": ["time"]}})
+
+        replayed = DummyDataset.replay_history(ds.get_history())
+        assert list(replayed.variables) == ["tas", "pr"]
+
+    def test_add_variables_conflict(self):
+        """Test that a size conflict in add_variables leaves the dataset unchanged"""
+        ds = DummyDataset()
+        ds.add_dim("time", 4)
+
+        with pytest.raises(ValueError, match="Dimension mismatch for 'lat'"):
+            ds.add_variables(
+                {
+                    "a": {"dims": ["time", "lat"], "data": np.zeros((4, 3))},
+                    "b": {"dims": ["lat"], "data": np.zeros(2)},
+                }
+            )
+        assert ds.dims == {"time": 4}
+        assert not ds.variables
+
     def test_auto_dim_inference(self):
         """Test automatic dimension inference from data"""
         ds = DummyDataset()
@@ -195,6 +324,15 @@ class TestDummyDataset:
         with pytest.raises(ValueError, match="Unknown dimension"):
             ds.validate()
 
+    def test_validate_unknown_dimension_with_data(self):
+        """Test validation reports unknown dimensions of arrays with data"""
+        ds = DummyDataset()
+        ds.add_variable("test", dims=["time"], data=[1, 2, 3])
+        del ds.dims["time"]
+
+        with pytest.raises(ValueError, match="Unknown dimension 'time'"):
+            ds.validate()
+
     def test_validate_shape_mismatch(self):
         """Test validation catches shape mismatches during add_variable"""
         ds = DummyDataset()
@@ -557,6 +695,25 @@ class TestDummyDataset:
         assert "✓" in repr_after
         assert "float64" in repr_after or "int64" in repr_after
 
+    def test_repr_with_list_data(self):
+        """Test repr for DummyDataset with list-backed data"""
+        ds = DummyDataset()
+        ds.add_coord("x", dims=["x"], data=[1, 2, 3])
+
+        repr_str = repr(ds)
+        assert "✓" in repr_str
+        assert "int64" in repr_str
+
+    def test_repr_does_not_load_lazy_data(self):
+        """Test repr reads dtype from a duck array without converting it"""
+        data = LazyArray((3,))
+        ds = DummyDataset()
+        ds.add_dim("x", 3)
+        ds.coords["x"] = DummyArray(dims=["x"], data=data)
+
+        assert "float32" in repr(ds)
+        assert data.conversions == 0
+
     def test_attribute_access_coords(self):
         """Test attribute-style access for coordinates"""
         ds = DummyDataset()
@@ -599,6 +756,19 @@ class TestDummyDataset:
         with pytest.raises(AttributeError, match="no attribute 'nonexistent'"):
             _ = ds.nonexistent
 
+    def test_deepcopy(self):
+        """Test that a dataset can be deep-copied"""
+        import copy
+
+        ds = DummyDataset()
+        ds.add_dim("time", 3)
+        ds.add_variable("temperature", ["time"], data=[1, 2, 3])
+
+        copied = copy.deepcopy(ds)
+        assert copied.temperature is not ds.temperature
+        assert copied.temperature.data == [1, 2, 3]
+        assert copied.dims == {"time": 3}
+
     def test_attribute_set_error(self):
         """Test that setting attributes directly is not allowed"""
         ds = DummyDataset()
@@ -1,6 +1,7 @@
 """Tests for data generation functionality (DataGenerationMixin)."""
 
 import numpy as np
+import pytest
 
 from dummyxarray import DummyDataset
 
@@ -36,6 +37,44 @@ class TestPopulateWithRandomData:
 
         np.testing.assert_array_equal(data1, data2)
 
+    def test_populate_fill_zeros(self, dataset_with_coords):
+        """Test shape-only population with zeros."""
+        ds = dataset_with_coords
+        ds.add_variable("tas", dims=["time", "lat"], attrs={"units": "K"})
+        ds.populate_with_random_data(fill="zeros")
+
+        assert ds.variables["tas"].data.shape == (ds.dims["time"], ds.dims["lat"])
+        assert not ds.variables["tas"].data.any()
+        # Coordinates still get meaningful values
+        assert ds.coords["lat"].data.min() == -90
+
+    def test_populate_fill_invalid(self, dataset_with_coords):
+        """Test that an unknown fill mode raises."""
+        with pytest.raises(ValueError, match="Unknown fill mode"):
+            dataset_with_coords.populate_with_random_data(fill="ones")
+
+    def test_populate_parallel_matches_serial(self, monkeypatch):
+        """Test that threaded sampling gives the same data as serial sampling."""
+        from dummyxarray import data_generation
+
+        def build():
+            ds = DummyDataset()
+            ds.add_dim("time", 20)
+            ds.add_variable("tas", dims=["time"], attrs={"units": "K"})
+            ds.add_variable("pr", dims=["time"])
+            ds.add_variable("other", dims=["time"])
+            return ds
+
+        serial = build().populate_with_random_data(seed=7)
+        monkeypatch.setattr(data_generation, "_PARALLEL_MIN_SIZE", 0)
+        monkeypatch.setattr(data_generation.os, "cpu_count", lambda: 4)
+        parallel = build().populate_with_random_data(seed=7)
+
+        for name in serial.variables:
+            np.testing.assert_array_equal(
+                serial.variables[name].data, parallel.variables[name].data
+            )
+
     def test_populate_method_chaining(self, dataset_with_coords):
         """Test that populate returns self for chaining."""
         result = dataset_with_coords.populate_with_random_data(seed=42)
@@ -70,6 +109,19 @@ class TestCoordinateDataGeneration:
         assert lat_data.max() <= 90
         assert len(lat_data) == 5
 
+    def test_generate_latitude_coordinate_independent(self):
+        """Test that generated coordinates are writable and not shared."""
+        datasets = []
+        for _ in range(2):
+            ds = DummyDataset()
+            ds.add_dim("lat", 5)
+            ds.add_coord("lat", dims=["lat"], attrs={"units": "degrees_north"})
+            ds.populate_with_random_data(seed=42)
+            datasets.append(ds)
+
+        datasets[0].coords["lat"].data[0] = 0.0
+        assert datasets[1].coords["lat"].data[0] == -90
+
     def test_generate_longitude_coordinate(self):
         """Test longitude coordinate data generation."""
         ds = DummyDataset()
@@ -95,6 +147,33 @@ class TestCoordinateDataGeneration:
         assert len(plev_data) == 5
         assert plev_data[0] > plev_data[-1]  # High pressure to low pressure
 
+    def test_generate_coordinate_encoded_dtype(self):
+        """Test that coordinates are generated in a fitting encoded dtype."""
+        ds = DummyDataset()
+        ds.add_dim("time", 10)
+        ds.add_dim("lat", 5)
+        ds.add_dim("x", 300)
+        ds.add_coord("time", dims=["time"], encoding={"dtype": "int32"})
+        ds.add_coord("lat", dims=["lat"], encoding={"dtype": "float32"})
+        ds.add_coord("x", dims=["x"], encoding={"dtype": "int8"})
+        ds.populate_with_random_data(seed=42)
+
+        assert ds.coords["time"].data.dtype == np.int32
+        assert ds.coords["lat"].data.dtype == np.float32
+        # int8 cannot hold 300 values, so the default dtype is kept
+        np.testing.assert_array_equal(ds.coords["x"].data, np.arange(300))
+
+    def test_generate_coordinate_encoded_dtype_full_range(self):
+        """Test that a dimension whose last index is the dtype maximum keeps it."""
+        ds = DummyDataset()
+        ds.add_dim("x", 128)
+        ds.add_coord("x", dims=["x"], encoding={"dtype": "int8"})
+        ds.populate_with_random_data(seed=42)
+
+        # Values 0..127 fit int8 exactly
+        assert ds.coords["x"].data.dtype == np.int8
+        assert ds.coords["x"].data[-1] == 127
+
 
 class TestVariableDataGeneration:
     """Test variable-specific data generation."""
@@ -178,3 +257,14 @@ class TestVariableDataGeneration:
         data = ds.variables["unknown_var"].data
         assert isinstance(data, np.ndarray)
         assert len(data) == 10
+
+    def test_generate_uses_float32_encoding(self):
+        """Test that a float32 encoding is honoured when sampling."""
+        ds = DummyDataset()
+        ds.add_dim("time", 10)
+        ds.add_variable("tas", dims=["time"], attrs={"units": "K"}, encoding={"dtype": "float32"})
+        ds.add_variable("other", dims=["time"])
+        ds.populate_with_random_data(seed=42)
+
+        assert ds.variables["tas"].data.dtype == np.float32
+        assert ds.variables["other"].data.dtype == np.float64
@@ -203,6 +203,22 @@ class TestDummyDatasetHistory:
         history = ds.get_history()
         assert history == []
 
+    def test_history_maxlen(self):
+        """Test that history_maxlen keeps only the most recent operations."""
+        ds = DummyDataset(history_maxlen=2)
+        ds.add_dim("time", 10)
+        ds.add_dim("lat", 64)
+
+        history = ds.get_history()
+        assert isinstance(history, list)
+        assert [op["func"] for op in history] == ["add_dim", "add_dim"]
+        assert history[1]["args"] == {"name": "lat", "size": 64}
+
+        ds.reset_history()
+        ds.add_dim("lon", 128)
+        ds.add_dim("lev", 5)
+        assert len(ds.get_history()) == 2
+
     def test_complex_workflow(self):
         """Test a complex workflow with history."""
         ds = DummyDataset()
@@ -48,6 +48,19 @@ class TestJSONExport:
         json_str = simple_dataset.to_json(indent=4)
         assert "    " in json_str  # Check for 4-space indent
 
+    def test_to_json_compact(self, simple_dataset):
+        """Test compact JSON export."""
+        json_str = simple_dataset.to_json(indent=None)
+        assert "\n" not in json_str
+        assert json.loads(json_str) == json.loads(simple_dataset.to_json())
+
+    def test_save_json(self, simple_dataset, tmp_path):
+        """Test saving JSON files."""
+        path = tmp_path / "spec.json"
+        simple_dataset.save_json(path)
+
+        assert path.read_text() == simple_dataset.to_json()
+
 
 class TestYAMLExport:
     """Test YAML export functionality."""
@@ -61,6 +74,23 @@ class TestYAMLExport:
         assert "dimensions" in parsed
         assert "coordinates" in parsed
 
+    def test_to_yaml_same_text_for_both_emitters(self, dataset_with_coords):
+        """Test that YAML text does not depend on whether libyaml is used."""
+        from dummyxarray import io
+
+        # Non-ASCII text is double-quoted, which the two emitters fold differently
+        dataset_with_coords.attrs["history"] = "Température " + "moyenne " * 20
+        text = dataset_with_coords.to_yaml()
+
+        pure = yaml.dump(
+            dataset_with_coords.to_dict(),
+            Dumper=yaml.Dumper,
+            sort_keys=False,
+            width=io._YAML_WIDTH,
+        )
+        assert text == pure
+        assert yaml.safe_load(text)["attrs"]["history"] == dataset_with_coords.attrs["history"]
+
     def test_save_and_load_yaml(self, dataset_with_coords, temp_yaml_file):
         """Test saving and loading YAML files."""
         # Save
@@ -98,6 +128,16 @@ class TestXarrayConversion:
         dummy_ds = DummyDataset.from_xarray(xr_ds, include_data=True)
         assert dummy_ds.variables["temperature"].data is not None
 
+    def test_from_xarray_lazy_data(self):
+        """Test that lazy=True keeps the underlying array without loading it."""
+        import numpy as np
+        import xarray as xr
+
+        xr_ds = xr.Dataset({"temperature": (["time"], np.arange(4.0))})
+
+        dummy_ds = DummyDataset.from_xarray(xr_ds, include_data=True, lazy=True)
+        assert dummy_ds.variables["temperature"].data is xr_ds["temperature"].data
+
     def test_to_xarray(self, dataset_with_data):
         """Test converting DummyDataset to xarray.Dataset."""
         xr_ds = dataset_with_data.to_xarray()
@@ -105,6 +145,18 @@ class TestXarrayConversion:
         assert "temperature" in xr_ds
         assert xr_ds.dims == {"time": 10, "lat": 5, "lon": 8}
 
+    def test_to_xarray_encoding(self):
+        """Test that encodings are carried over to xarray."""
+        ds = DummyDataset()
+        ds.add_coord("time", dims=["time"], data=[0, 1, 2], encoding={"units": "days"})
+        ds.add_variable("t", dims=["time"], data=[1.0, 2.0, 3.0], encoding={"dtype": "float32"})
+        ds.add_variable("u", dims=["time"], data=[1.0, 2.0, 3.0])
+
+        xr_ds = ds.to_xarray()
+        assert xr_ds["time"].encoding == {"units": "days"}
+        assert xr_ds["t"].encoding == {"dtype": "float32"}
+        assert xr_ds["u"].encoding == {}
+
     def test_to_xarray_missing_data(self, dataset_with_coords):
         """Test that to_xarray fails when data is missing."""
         with pytest.raises(ValueError, match="missing data"):
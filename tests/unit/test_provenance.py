@@ -32,6 +32,27 @@ class TestProvenance:
         assert "modified" in prov
         assert prov["modified"]["units"] == {"before": "degC", "after": "K"}
 
+    def test_provenance_assign_attrs_unchanged(self):
+        """Test that re-assigning identical attributes records no provenance."""
+        ds = DummyDataset()
+        ds.assign_attrs(units="K", title="Test")
+        ds.assign_attrs(units="K", title="New")
+        ds.assign_attrs(units="K")
+
+        history = ds.get_history()
+        assert history[2]["provenance"]["modified"] == {"title": {"before": "Test", "after": "New"}}
+        assert "provenance" not in history[3]
+        assert history[3]["args"] == {"units": "K"}
+
+    def test_provenance_assign_attrs_type_change(self):
+        """Test that changing an attribute's type is recorded as a modification."""
+        ds = DummyDataset()
+        ds.assign_attrs(scale=1)
+        ds.assign_attrs(scale=1.0)
+
+        prov = ds.get_history()[2]["provenance"]
+        assert prov["modified"] == {"scale": {"before": 1, "after": 1.0}}
+
     def test_provenance_add_dim_new(self):
         """Test provenance for adding new dimension."""
         ds = DummyDataset()
@@ -106,6 +127,40 @@ class TestProvenance:
         assert prov_list[0]["func"] == "add_dim"
         assert prov_list[1]["func"] == "assign_attrs"
 
+    def test_get_provenance_all_after_new_operations(self):
+        """Test that repeated calls reflect operations recorded in between."""
+        ds = DummyDataset()
+        ds.add_dim("time", 10)
+        assert len(ds.get_provenance()) == 1
+
+        ds.assign_attrs(units="K")
+        assert len(ds.get_provenance()) == 2
+
+        ds.reset_history()
+        assert ds.get_provenance() == []
+
+    def test_get_provenance_entries_independent(self):
+        """Test that changing a returned entry does not affect later results."""
+        ds = DummyDataset()
+        ds.add_dim("time", 10)
+
+        entry = ds.get_provenance()[0]
+        entry["func"] = "changed"
+        entry["extra"] = True
+
+        assert ds.get_provenance() == [
+            {"index": 1, "func": "add_dim", "provenance": {"added": ["time"]}}
+        ]
+
+    def test_reset_history_clears_provenance_cache(self):
+        """Test that reset_history drops the cached provenance."""
+        ds = DummyDataset()
+        ds.add_dim("time", 10)
+        ds.get_provenance()
+
+        ds.reset_history()
+        assert ds._prov_cache is None
+
     def test_get_provenance_specific(self):
         """Test getting provenance for specific operation."""
         ds = DummyDataset()
@@ -234,6 +289,19 @@ class TestProvenance:
         assert ds.coords["time"].dims == ["t"]
         assert ds.variables["temp"].dims == ["t"]
 
+    def test_rename_dims_multiple_updates_references(self):
+        """Test that renames are applied simultaneously to references."""
+        ds = DummyDataset()
+        ds.add_dim("x", 3)
+        ds.add_dim("y", 4)
+        ds.add_variable("field", dims=["x", "y"])
+        ds.add_variable("other", dims=["y"])
+        ds.rename_dims(x="lon", y="lat")
+
+        assert ds.dims == {"lon": 3, "lat": 4}
+        assert ds.variables["field"].dims == ["lon", "lat"]
+        assert ds.variables["other"].dims == ["lat"]
+
     def test_rename_dims_errors(self):
         """Test rename_dims error handling."""
         ds = DummyDataset()
@@ -301,6 +369,19 @@ class TestProvenance:
         assert "t" in ds.dims
         assert "temp" in ds.variables
 
+    def test_rename_existing_name_errors(self):
+        """Test rename() rejects targets that already exist, leaving the dataset unchanged."""
+        ds = DummyDataset()
+        ds.add_dim("x", 3)
+        ds.add_dim("y", 3)
+        ds.add_variable("v", dims=["x", "y"])
+
+        with pytest.raises(ValueError, match="Dimension 'y' already exists"):
+            ds.rename({"x": "y", "y": "z"})
+
+        assert ds.dims == {"x": 3, "y": 3}
+        assert ds.variables["v"].dims == ["x", "y"]
+
     def test_visualize_provenance_rename(self):
         """Test provenance visualization with renames."""
         ds = DummyDataset()